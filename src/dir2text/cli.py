@@ -46,7 +46,7 @@ from collections.abc import Mapping
 from pathlib import Path
 from threading import Event
 from types import FrameType
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 from dir2text.dir2text import StreamingDir2Text
 from dir2text.file_system_tree import PermissionAction
@@ -109,11 +109,17 @@ class SafeWriter:
     signals that might interrupt the process. It handles both file and
     file descriptor outputs.
 
+    Output is collected in memory and encoded and written with a single system call once at
+    least BUFFER_SIZE characters are pending, so streaming many small pieces (such as tree lines)
+    does not cost one write per piece. Pending output is written by flush() and close().
+
     Attributes:
         file: Either a file path or file descriptor for output.
         fd: The actual file descriptor being written to.
     """
 
+    BUFFER_SIZE = 65536
+
     def __init__(self, file: Union[int, Path]):
         """Initialize the safe writer.
 
@@ -121,11 +127,18 @@ class SafeWriter:
             file: Either a file descriptor (int) or Path object for writing output.
         """
         self.file = file
-        self.fd = file if isinstance(file, int) else file.open("w").fileno()
+        # Open the path at the OS level; the descriptor of a Path.open() file object would be
+        # closed as soon as that object was garbage collected
+        self.fd = file if isinstance(file, int) else os.open(file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        self._buffer: List[str] = []
+        self._buffered_size = 0
 
     def write(self, data: str) -> None:
         """Safely write data with signal checking.
 
+        Signals are checked whenever buffered output is flushed, so an interruption is noticed
+        within at most BUFFER_SIZE characters of further output.
+
         Args:
             data: String data to write.
 
@@ -133,19 +146,48 @@ class SafeWriter:
             BrokenPipeError: If SIGPIPE received or pipe is broken.
             OSError: If an I/O error occurs during writing.
         """
+        self._buffer.append(data)
+        self._buffered_size += len(data)
+        if self._buffered_size >= self.BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all pending output to the file descriptor.
+
+        Raises:
+            BrokenPipeError: If SIGPIPE received or pipe is broken.
+            OSError: If an I/O error occurs during writing.
+        """
+        if not self._buffer:
+            return
         if signal_handler.sigpipe_received.is_set() or signal_handler.sigint_received.is_set():
             raise BrokenPipeError()
+        # Joining first and encoding once is about twice as fast as encoding each piece
+        pending = memoryview("".join(self._buffer).encode())
+        self._buffer = []
+        self._buffered_size = 0
         try:
-            os.write(self.fd, data.encode())
+            # A write interrupted by a signal may be partial; keep going until everything is out
+            while pending:
+                written = os.write(self.fd, pending)
+                pending = pending[written:]
         except OSError as e:
             if e.errno == errno.EPIPE:
                 raise BrokenPipeError()
             raise
 
     def close(self) -> None:
-        """Close the file descriptor if it was opened by this class."""
-        if not isinstance(self.file, int):
-            os.close(self.fd)
+        """Write any pending output and close the file descriptor if it was opened by this class.
+
+        A broken pipe while writing the pending output is ignored, since the reader is gone.
+        """
+        try:
+            self.flush()
+        except BrokenPipeError:
+            pass
+        finally:
+            if not isinstance(self.file, int):
+                os.close(self.fd)
 
 
 def cleanup() -> None:
@@ -82,6 +82,25 @@ class BaseExclusionRules(ABC):
         """
         pass
 
+    def may_include_below(self, directory: str) -> bool:
+        """
+        Determine whether any path below a directory could be included by the rules.
+
+        Callers use this to decide whether a directory whose descendants are all excluded
+        by a directory pattern (e.g., "build/") still has to be listed, because a rule could
+        re-include one of them. Implementations that cannot tell should keep this default of
+        True, which is always safe.
+
+        Args:
+            directory (str): The directory path relative to the root, using forward slashes
+                and without a trailing slash.
+
+        Returns:
+            bool: True if a path below the directory may be included, False if the rules
+                can never include one.
+        """
+        return True
+
     @abstractmethod
     def load_rules(self, rules_file: str) -> None:
         """
@@ -1,13 +1,44 @@
 """Implementation of exclusion rules using .gitignore pattern syntax."""
 
 import os
+import re
+from fnmatch import fnmatchcase
+from typing import Dict, List, Optional, cast
 
 from pathspec import PathSpec
+from pathspec.pattern import RegexPattern
 from pathspec.patterns import GitWildMatchPattern  # type: ignore
+from pathspec.util import normalize_file
 
 from .base_rules import BaseExclusionRules
 
 
+def _negation_may_match_below(negation: str, directory: str) -> bool:
+    """Check whether a negation pattern might match a directory or any path below it.
+
+    The check is conservative: it only returns False when the pattern certainly cannot match.
+
+    Args:
+        negation: The negation pattern without its leading "!".
+        directory: The directory path, using forward slashes and without a trailing slash.
+
+    Returns:
+        bool: False if the pattern cannot match the directory or its descendants, True otherwise.
+    """
+    body = negation[:-1] if negation.endswith("/") else negation
+    if "/" not in body:
+        return True  # Unanchored: matches at any depth
+    pattern_segments = body.lstrip("/").split("/")
+    for pattern_segment, directory_segment in zip(pattern_segments, directory.split("/")):
+        if pattern_segment == "**":
+            return True
+        # Escapes are not interpreted by fnmatch, so escaped segments are assumed to match
+        if "\\" not in pattern_segment and not fnmatchcase(directory_segment, pattern_segment):
+            return False
+    # The pattern matches an ancestor of the directory, the directory itself, or continues below it
+    return True
+
+
 class GitIgnoreExclusionRules(BaseExclusionRules):
     """Implementation of exclusion rules using .gitignore pattern syntax.
 
@@ -22,6 +53,10 @@ class GitIgnoreExclusionRules(BaseExclusionRules):
     - Double-asterisk matching (**)
     - Comment lines (starting with #)
 
+    For matching, all patterns are additionally compiled into a single regular expression
+    in reverse order, so that one scan finds the last matching pattern (which determines
+    the outcome under .gitignore semantics) instead of testing every pattern in turn.
+
     Attributes:
         spec (PathSpec): Compiled pattern matcher from the pathspec library.
 
@@ -64,6 +99,10 @@ class GitIgnoreExclusionRules(BaseExclusionRules):
             >>> os.unlink(f.name)
         """
         self.spec: PathSpec
+        self._regex: Optional[re.Pattern[str]] = None
+        self._includes: Dict[str, bool] = {}
+        # Negation patterns without their leading "!", in file order
+        self._negations: List[str] = []
         self.load_rules(rules_file)
 
     def exclude(self, path: str) -> bool:
@@ -95,7 +134,40 @@ class GitIgnoreExclusionRules(BaseExclusionRules):
             False
             >>> os.unlink(f.name)
         """
-        return self.spec.match_file(path)
+        if self._regex is None:
+            return False
+        match = self._regex.match(normalize_file(path))
+        if match is None or match.lastgroup is None:
+            return False
+        return self._includes[match.lastgroup]
+
+    def may_include_below(self, directory: str) -> bool:
+        """Check whether a negation pattern could re-include a path below a directory.
+
+        Only negation patterns can re-include a path, so this is True exactly when some
+        negation might match the directory or one of its descendants. Unanchored negations
+        (e.g., "!important.log") match at any depth. Anchored ones are compared segment by
+        segment with the directory.
+
+        Args:
+            directory: The directory path, using forward slashes and without a trailing slash.
+
+        Returns:
+            bool: True if a negation might match below the directory, False otherwise.
+
+        Example:
+            >>> import tempfile
+            >>> import os
+            >>> with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            ...     _ = f.write('build/\\ndist/\\n!dist/keep.txt\\n')
+            >>> rules = GitIgnoreExclusionRules(f.name)
+            >>> rules.may_include_below("build")
+            False
+            >>> rules.may_include_below("dist")
+            True
+            >>> os.unlink(f.name)
+        """
+        return any(_negation_may_match_below(negation, directory) for negation in self._negations)
 
     def load_rules(self, rules_file: str) -> None:
         """Load and compile .gitignore patterns from a file.
@@ -136,3 +208,30 @@ class GitIgnoreExclusionRules(BaseExclusionRules):
         with open(rules_file, "r") as f:
             gitignore_content = f.read().splitlines()
         self.spec = PathSpec.from_lines(GitWildMatchPattern, gitignore_content)
+        self._compile()
+
+    def _compile(self) -> None:
+        """Compile the loaded patterns into a single alternation regex.
+
+        Alternatives are ordered from the last pattern to the first. Since the regex engine
+        returns the first alternative that matches, a single match call yields the last
+        matching pattern, exactly as pathspec's sequential evaluation would. Each alternative
+        is wrapped in a named group so its include/exclude flag can be looked up from
+        match.lastgroup. pathspec's own named groups are made non-capturing because group
+        names must be unique within one expression.
+        """
+        alternatives: List[str] = []
+        self._includes = {}
+        self._negations = []
+        # Every pattern is a GitWildMatchPattern, i.e. a RegexPattern, since that is the factory used above
+        for pattern in reversed(cast(List[RegexPattern], list(self.spec.patterns))):
+            if pattern.include is None:
+                continue
+            source = re.sub(r"\(\?P<\w+>", "(?:", pattern.regex.pattern)
+            group = f"p{len(alternatives)}"
+            alternatives.append(f"(?P<{group}>{source})")
+            self._includes[group] = pattern.include
+            if not pattern.include:
+                # Patterns were created from str lines, so their source text is a str
+                self._negations.append(cast(str, pattern.pattern)[1:])
+        self._regex = re.compile("|".join(alternatives)) if alternatives else None
@@ -5,7 +5,7 @@ and optional content counting. It provides configurable encoding support
 for reading files while maintaining memory-efficient streaming behavior.
 """
 
-from typing import Iterator, Optional, Tuple, Union
+from typing import Iterator, List, Optional, Tuple, Union
 
 from .file_system_tree import FileSystemTree
 from .io.chunked_file_reader import ChunkedFileReader
@@ -14,6 +14,10 @@ from .output_strategies.json_strategy import JSONOutputStrategy
 from .output_strategies.xml_strategy import XMLOutputStrategy
 from .token_counter import TokenCounter
 
+# Number of formatted chunks tokenized together when a file's token count is needed up front.
+# Kept small so the batch stays within a few chunks of memory.
+_TOKEN_BATCH_SIZE = 4
+
 
 class FileContentPrinter:
     """Streams file content with consistent formatting while maintaining constant memory usage.
@@ -130,8 +134,15 @@ class FileContentPrinter:
         try:
             with open(file_path, "r", encoding=self.encoding, errors=self.errors) as file:
                 reader = ChunkedFileReader(file)
+                # Nothing is emitted until the count is known, so chunks can be tokenized in batches
+                batch: List[str] = []
                 for chunk in reader:
-                    token_count += self.tokenizer.count(self.output_strategy.format_content(chunk)).tokens
+                    batch.append(self.output_strategy.format_content(chunk))
+                    if len(batch) == _TOKEN_BATCH_SIZE:
+                        token_count += sum(result.tokens for result in self.tokenizer.count_batch(batch))
+                        batch = []
+                if batch:
+                    token_count += sum(result.tokens for result in self.tokenizer.count_batch(batch))
         except UnicodeError as e:
             raise ValueError(
                 f"Failed to decode '{relative_path}' with {self.encoding} "
@@ -162,11 +173,12 @@ class FileContentPrinter:
         if self.tokenizer is not None and self.output_strategy.requires_tokens_in_start:
             token_count = self._count_file_tokens(file_path, relative_path)
 
-        # Output start tag with token count if available
-        yield self.output_strategy.format_start(relative_path, token_count)
+        # Start tag with token count if available. It is held back and emitted together with the
+        # first chunk (or the end tag for empty files) so that each file needs one write fewer.
+        pending_start = self.output_strategy.format_start(relative_path, token_count)
 
-        if self.tokenizer is not None and not self.output_strategy.requires_tokens_in_start:
-            token_count = 0
+        # Tokens counted while streaming, used when the count is not needed up front
+        streamed_token_count = 0
 
         try:
             with open(file_path, "r", encoding=self.encoding, errors=self.errors) as file:
@@ -175,8 +187,12 @@ class FileContentPrinter:
                     formatted_chunk = self.output_strategy.format_content(chunk)
                     # Only count tokens during processing if we haven't counted them upfront
                     if self.tokenizer is not None and not self.output_strategy.requires_tokens_in_start:
-                        token_count += self.tokenizer.count(formatted_chunk).tokens
-                    yield formatted_chunk
+                        streamed_token_count += self.tokenizer.count(formatted_chunk).tokens
+                    if pending_start:
+                        yield pending_start + formatted_chunk
+                        pending_start = ""
+                    else:
+                        yield formatted_chunk
 
         except ValueError as e:
             # Handle invalid 'errors' parameter - this comes from open()
@@ -191,11 +207,11 @@ class FileContentPrinter:
             # Add context to OS-level errors
             raise OSError(f"Failed to read '{relative_path}': {str(e)}") from e
 
-        # Output end tag
+        # Output end tag, preceded by the start tag if the file had no content
         if self.tokenizer is not None and not self.output_strategy.requires_tokens_in_start:
-            yield self.output_strategy.format_end(token_count)
+            yield pending_start + self.output_strategy.format_end(streamed_token_count)
         else:
-            yield self.output_strategy.format_end()
+            yield pending_start + self.output_strategy.format_end()
 
     def yield_file_contents(self) -> Iterator[Tuple[str, str, Iterator[str]]]:
         """Stream file content with metadata and formatting.
@@ -6,13 +6,23 @@ specified rules.
 """
 
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Iterator, Optional, Tuple
+from typing import Any, Iterator, List, Optional, Set, Tuple
 
 from anytree import Node
 
 from dir2text.exclusion_rules.base_rules import BaseExclusionRules
 
+# Line-drawing fragments used by the tree representation
+_CONNECTOR = "├── "
+_LAST_CONNECTOR = "└── "
+_INDENT = "│   "
+_LAST_INDENT = "    "
+_DIR_SUFFIX = "/"
+_FILE_SUFFIX = ""
+
 
 class PermissionAction(str, Enum):
     """Action to take when encountering permission errors during directory traversal.
@@ -26,18 +36,35 @@ class PermissionAction(str, Enum):
     RAISE = "raise"
 
 
-class FileSystemNode(Node):  # type: ignore
+class _NodeSlots:
+    """Slotted storage for FileSystemNode internals.
+
+    Attributes stored here live outside the instance __dict__, which anytree walks for
+    repr() and for exporters such as DictExporter and JsonExporter.
+    """
+
+    __slots__ = ("_display_children", "dir_entry")
+
+    _display_children: Optional[Tuple["FileSystemNode", ...]]
+    dir_entry: Optional["os.DirEntry[str]"]
+
+
+class FileSystemNode(_NodeSlots, Node):  # type: ignore
     """Node class representing a file or directory in the filesystem tree.
 
     Extends anytree.Node to add a flag indicating whether the node represents
-    a directory. Inherits all tree traversal and manipulation capabilities
-    from anytree.Node.
+    a directory, and optionally the os.DirEntry the node was created from. Inherits
+    all tree traversal and manipulation capabilities from anytree.Node.
 
     Attributes:
         name (str): The name of the file or directory (just the basename).
         parent (Optional[FileSystemNode]): The parent node in the tree.
         is_dir (bool): True if this node represents a directory, False for files.
+        dir_entry (Optional[os.DirEntry[str]]): The directory entry the node was created
+            from, if retained. Its stat result is cached after the first stat() call.
         children (tuple[FileSystemNode]): The child nodes (inherited from anytree.Node).
+        display_children (tuple[FileSystemNode]): The child nodes in display order,
+            computed once and cached until a child is attached or detached.
 
     Example:
         >>> root = FileSystemNode("root", is_dir=True)
@@ -49,7 +76,12 @@ class FileSystemNode(Node):  # type: ignore
     """
 
     def __init__(
-        self, name: str, parent: Optional["FileSystemNode"] = None, is_dir: bool = False, **kwargs: Any
+        self,
+        name: str,
+        parent: Optional["FileSystemNode"] = None,
+        is_dir: bool = False,
+        dir_entry: Optional["os.DirEntry[str]"] = None,
+        **kwargs: Any,
     ) -> None:
         """Initialize a FileSystemNode.
 
@@ -57,6 +89,7 @@ class FileSystemNode(Node):  # type: ignore
             name: The name of the file or directory.
             parent: The parent node. Defaults to None.
             is_dir: Whether this node represents a directory. Defaults to False.
+            dir_entry: The directory entry the node was created from. Defaults to None.
             **kwargs: Additional arguments passed to anytree.Node.
 
         Example:
@@ -66,8 +99,63 @@ class FileSystemNode(Node):  # type: ignore
             >>> node.is_dir
             False
         """
+        self._display_children = None
         super().__init__(name, parent, **kwargs)
         self.is_dir = is_dir
+        self.dir_entry = dir_entry
+
+    def stat(self) -> Optional[os.stat_result]:
+        """Get the stat result for this node, following symbolic links.
+
+        The result comes from the retained directory entry, which performs at most one
+        system call and caches the result for subsequent calls.
+
+        Returns:
+            The stat result, or None if no directory entry was retained for this node
+            (e.g., for the root node, or when the tree was built without retaining entries).
+
+        Example:
+            >>> FileSystemNode("example.txt").stat() is None
+            True
+        """
+        if self.dir_entry is None:
+            return None
+        return self.dir_entry.stat()
+
+    @property
+    def display_children(self) -> Tuple["FileSystemNode", ...]:
+        """Get the child nodes in display order.
+
+        Directories come first, then files, both sorted case-insensitively by name. The
+        sorted tuple is cached and invalidated whenever a child is attached or detached.
+
+        Returns:
+            The child nodes in display order.
+
+        Example:
+            >>> root = FileSystemNode("root", is_dir=True)
+            >>> _ = FileSystemNode("b.txt", parent=root)
+            >>> _ = FileSystemNode("A.txt", parent=root)
+            >>> _ = FileSystemNode("sub", parent=root, is_dir=True)
+            >>> [child.name for child in root.display_children]
+            ['sub', 'A.txt', 'b.txt']
+        """
+        if self._display_children is None:
+            self._display_children = tuple(sorted(self.children, key=_display_key))
+        return self._display_children
+
+    def _post_attach(self, parent: "FileSystemNode") -> None:
+        """Invalidate the parent's cached display order after this node is attached."""
+        parent._display_children = None
+
+    def _post_detach(self, parent: "FileSystemNode") -> None:
+        """Invalidate the parent's cached display order after this node is detached."""
+        parent._display_children = None
+
+
+def _display_key(node: FileSystemNode) -> Tuple[bool, str]:
+    """Sort key placing directories before files, each ordered case-insensitively by name."""
+    return (not node.is_dir, node.name.lower())
 
 
 class FileSystemTree:
@@ -82,21 +170,30 @@ class FileSystemTree:
     changes. Both full tree access and iterative file listing are supported.
 
     Symbolic Link Behavior:
-        The current implementation follows symbolic links during traversal without
-        detecting or preventing symlink loops. Users should be cautious when processing
-        directories containing circular symbolic links, as this could lead to infinite
-        recursion. Future versions may add configuration options for controlling
-        symlink handling.
+        Symbolic links are followed during traversal. A directory that resolves to one of
+        its own ancestors (a symlink loop) is kept as a node but its contents are not
+        traversed again. Directories are identified by their resolved real paths. These
+        are derived from the parent's real path without any system call, and are only
+        resolved through the filesystem for entries that are themselves symbolic links.
 
     Permission Handling:
         Permission errors during traversal can be handled in two ways:
         - IGNORE (default): Silently skip inaccessible files/directories
         - RAISE: Immediately raise PermissionError when access is denied
 
+    Parallel Traversal:
+        When parallel is True, each top-level entry of the root directory is built as an
+        independent subtree on a thread pool and the results are attached to the root in
+        sorted order. This overlaps filesystem latency across siblings and mainly helps
+        wide trees on slow or network filesystems. The resulting tree is identical to the
+        one built serially.
+
     Attributes:
         root_path (str): The absolute path to the root directory.
         exclusion_rules (Optional[BaseExclusionRules]): Rules for excluding files/directories.
         permission_action (PermissionAction): How to handle permission errors.
+        parallel (bool): Whether top-level subtrees are built concurrently.
+        keep_dir_entries (bool): Whether nodes retain their os.DirEntry for cached stat().
 
     Example:
         >>> # Create a tree for the current directory without exclusions
@@ -114,6 +211,8 @@ class FileSystemTree:
         root_path: str,
         exclusion_rules: Optional[BaseExclusionRules] = None,
         permission_action: PermissionAction = PermissionAction.IGNORE,
+        parallel: bool = False,
+        keep_dir_entries: bool = False,
     ) -> None:
         """Initialize a FileSystemTree.
 
@@ -122,6 +221,11 @@ class FileSystemTree:
             exclusion_rules: Rules for excluding files and directories. Defaults to None.
             permission_action: How to handle permission errors during traversal.
                 Defaults to IGNORE.
+            parallel: Whether to build top-level subtrees concurrently on a thread pool.
+                Defaults to False.
+            keep_dir_entries: Whether each node retains the os.DirEntry it was created from,
+                so FileSystemNode.stat() can reuse the entry's cached stat result. This costs
+                memory per node and is therefore off by default.
 
         Example:
             >>> tree = FileSystemTree(".")  # doctest: +SKIP
@@ -130,8 +234,14 @@ class FileSystemTree:
             42
         """
         self.root_path = os.path.abspath(root_path)
+        # Root path with a trailing separator, so absolute paths can be built by concatenation
+        self._root_prefix = os.path.join(self.root_path, "")
         self.exclusion_rules = exclusion_rules
         self.permission_action = permission_action
+        # Resolved once so permission error handlers test a plain bool instead of comparing enums
+        self._raise_on_permission_error = permission_action == PermissionAction.RAISE
+        self.parallel = parallel
+        self.keep_dir_entries = keep_dir_entries
         self._tree: Optional[FileSystemNode] = None
         self._file_count: int = 0
         self._directory_count: int = 0
@@ -176,18 +286,129 @@ class FileSystemTree:
             raise FileNotFoundError(f"Root path does not exist: {self.root_path}")
         if not os.path.isdir(self.root_path):
             raise NotADirectoryError(f"Root path is not a directory: {self.root_path}")
-        self._tree = self._create_node(self.root_path, "")
+        if self.parallel:
+            self._tree = self._create_root_node_parallel()
+        else:
+            self._tree = self._create_node(self.root_path, "")
         self._count_files_and_directories()
 
+    def _create_root_node_parallel(self) -> FileSystemNode:
+        """Create the root node, building each top-level subtree on a thread pool.
+
+        Each top-level entry is built detached from the tree by _create_node, so workers
+        never share nodes. Subtrees are attached to the root in sorted order once built.
+
+        Returns:
+            The root node.
+
+        Raises:
+            PermissionError: If access is denied and permission_action is RAISE.
+        """
+        root = FileSystemNode(os.path.basename(self.root_path), is_dir=True)
+        try:
+            entries = self._list_directory(self.root_path)
+        except PermissionError as e:
+            if self._raise_on_permission_error:
+                raise PermissionError(f"Access denied to {self.root_path}: {e}")
+            return root
+
+        # Each worker gets its own ancestor set, seeded with the root, for loop detection
+        root_real_path = os.path.realpath(self.root_path)
+        root_real_prefix = os.path.join(root_real_path, "")
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._create_node,
+                    entry.path,
+                    entry.name,
+                    None,
+                    entry_is_dir,
+                    self._child_real_path(root_real_prefix, entry, entry_is_dir),
+                    {root_real_path},
+                    entry,
+                )
+                for entry, entry_is_dir in entries
+            ]
+            for future in futures:
+                child_node = future.result()
+                if child_node is not None:
+                    child_node.parent = root
+        return root
+
+    @staticmethod
+    def _list_directory(path: str) -> List[Tuple["os.DirEntry[str]", bool]]:
+        """List a directory's entries in name order using os.scandir.
+
+        Args:
+            path: Absolute path of the directory to list.
+
+        Returns:
+            Tuples of (entry, is_dir) for each entry, sorted by name.
+
+        Raises:
+            PermissionError: If the directory cannot be read.
+        """
+        with os.scandir(path) as entries:
+            sorted_entries = sorted(entries, key=lambda entry: entry.name)
+        result = []
+        for entry in sorted_entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False  # Match os.path.isdir, which reports False on errors
+            result.append((entry, is_dir))
+        return result
+
+    @staticmethod
+    def _child_real_path(real_prefix: str, entry: "os.DirEntry[str]", is_dir: bool) -> Optional[str]:
+        """Get the real path of a child directory for loop detection.
+
+        A child that is not a symbolic link lives directly inside its parent's real path,
+        so its real path is derived by concatenation. Only symbolic links are resolved
+        through the filesystem.
+
+        Args:
+            real_prefix: The parent's real path with a trailing separator.
+            entry: The child's directory entry.
+            is_dir: Whether the child is a directory.
+
+        Returns:
+            The child's real path, or None if the child is not a directory.
+        """
+        if not is_dir:
+            return None
+        return os.path.realpath(entry.path) if entry.is_symlink() else f"{real_prefix}{entry.name}"
+
     def _create_node(
-        self, path: str, relative_path: str, parent: Optional[FileSystemNode] = None
+        self,
+        path: str,
+        relative_path: str,
+        parent: Optional[FileSystemNode] = None,
+        is_dir: Optional[bool] = None,
+        real_path: Optional[str] = None,
+        ancestors: Optional[Set[str]] = None,
+        dir_entry: Optional["os.DirEntry[str]"] = None,
     ) -> Optional[FileSystemNode]:
         """Recursively create tree nodes for a path and its children.
 
+        Directory contents are read with os.scandir, which retrieves entry types together
+        with the directory listing. This avoids a separate stat call per child, which
+        dominates traversal time on network and other high-latency filesystems.
+
         Args:
             path: Absolute path to create node for.
             relative_path: Path relative to root_path, used for exclusion checking.
             parent: Parent node. Defaults to None.
+            is_dir: Whether the path is a directory, if already known from a directory
+                entry. Defaults to None, in which case the filesystem is queried.
+            real_path: The resolved real path of a directory, if already known. Defaults
+                to None, in which case it is resolved through the filesystem.
+            ancestors: Real paths of the directories on the path from the root to this
+                node, used for symlink loop detection. Defaults to None, in which case a
+                new set is created.
+            dir_entry: The directory entry for the path, retained on the node if
+                keep_dir_entries is set. Defaults to None.
 
         Returns:
             The created node, or None if the path should be excluded.
@@ -195,27 +416,68 @@ class FileSystemTree:
         Raises:
             PermissionError: If access is denied and permission_action is RAISE.
         """
-        name = os.path.basename(path)
-        if self.exclusion_rules and self.exclusion_rules.exclude(relative_path):
+        if is_dir is None:
+            is_dir = os.path.isdir(path)
+        # The root (empty relative path) is never checked
+        if relative_path and self.exclusion_rules and self.exclusion_rules.exclude(relative_path):
             return None
 
-        is_dir = os.path.isdir(path)
-        node = FileSystemNode(name, parent=parent, is_dir=is_dir)
+        # Intern names so commonly repeated ones (__init__.py, README.md, ...) share one string object
+        name = sys.intern(os.path.basename(path))
+        node = FileSystemNode(
+            name, parent=parent, is_dir=is_dir, dir_entry=dir_entry if self.keep_dir_entries else None
+        )
 
         if is_dir:
+            if ancestors is None:
+                ancestors = set()
+            if real_path is None:
+                real_path = os.path.realpath(path)
+            if real_path in ancestors:
+                return node  # Symlink loop: keep the node but do not traverse it again
+            if relative_path and self._contents_excluded(relative_path):
+                return node  # Every child would be excluded, so the directory is kept but not listed
+            ancestors.add(real_path)
+            real_prefix = os.path.join(real_path, "")
             try:
-                for child in sorted(os.listdir(path)):
-                    child_path = os.path.join(path, child)
-                    child_relative_path = os.path.join(relative_path, child).replace("\\", "/")
-                    child_node = self._create_node(child_path, child_relative_path, parent=node)
-                    if child_node is None:
-                        node.children = [c for c in node.children if c is not child_node]
+                for entry, entry_is_dir in self._list_directory(path):
+                    child_relative_path = f"{relative_path}/{entry.name}" if relative_path else entry.name
+                    # Children attach themselves to node; excluded children return None and are never attached
+                    self._create_node(
+                        entry.path,
+                        child_relative_path,
+                        parent=node,
+                        is_dir=entry_is_dir,
+                        real_path=self._child_real_path(real_prefix, entry, entry_is_dir),
+                        ancestors=ancestors,
+                        dir_entry=entry,
+                    )
             except PermissionError as e:
-                if self.permission_action == PermissionAction.RAISE:
+                if self._raise_on_permission_error:
                     raise PermissionError(f"Access denied to {path}: {e}")
                 # For IGNORE, we keep the directory node but skip its contents
+            finally:
+                ancestors.discard(real_path)
         return node
 
+    def _contents_excluded(self, relative_path: str) -> bool:
+        """Check whether every path below a directory is excluded by the exclusion rules.
+
+        A directory-only pattern (e.g., "build/") does not match the directory's bare path, so
+        the directory itself stays in the tree, but it matches everything below it. Unless a
+        negation could re-include one of those paths, listing the directory would only yield
+        children that are excluded one by one, so it can be skipped without changing the tree.
+
+        Args:
+            relative_path: Path of the directory relative to root_path, using forward slashes.
+
+        Returns:
+            True if the directory's contents need not be listed, False otherwise.
+        """
+        if self.exclusion_rules is None or not self.exclusion_rules.exclude(f"{relative_path}/"):
+            return False
+        return not self.exclusion_rules.may_include_below(relative_path)
+
     def _count_files_and_directories(self) -> None:
         """Count the total number of files and directories in the tree.
 
@@ -293,20 +555,27 @@ class FileSystemTree:
             yield from self._iterate(self._tree, "")
 
     def _iterate(self, node: FileSystemNode, current_path: str) -> Iterator[Tuple[str, str]]:
-        """Recursive helper for iterate_files.
+        """Iterative helper for iterate_files.
+
+        Walks the tree depth-first with an explicit stack rather than recursive generators,
+        so each yielded file costs one generator resume regardless of its depth.
 
         Args:
-            node: Current node to process.
-            current_path: Path to the current node relative to root.
+            node: Node to start from.
+            current_path: Path to the starting node relative to root.
 
         Yields:
             Pairs of (absolute_path, relative_path) for each file.
         """
-        if not node.is_dir:
-            yield (os.path.join(self.root_path, current_path), current_path)
-        else:
-            for child in node.children:
-                yield from self._iterate(child, os.path.join(current_path, child.name))
+        stack = [(node, current_path)]
+        while stack:
+            node, current_path = stack.pop()
+            if not node.is_dir:
+                yield (f"{self._root_prefix}{current_path}", current_path)
+            else:
+                # Push children in reverse so they are popped in their original order
+                for child in reversed(node.children):
+                    stack.append((child, f"{current_path}{os.sep}{child.name}" if current_path else child.name))
 
     def stream_tree_representation(self) -> Iterator[str]:
         """Generate a tree representation of the filesystem one line at a time.
@@ -334,26 +603,26 @@ class FileSystemTree:
         if self._tree is None:
             return
 
-        def write_node(node: FileSystemNode, prefix: str = "", is_last: bool = True) -> Iterator[str]:
-            # Handle root node
-            if not node.parent:
-                yield f"{node.name}/"
-            else:
-                # Handle child nodes
-                connector = "└── " if is_last else "├── "
-                yield f"{prefix}{connector}{node.name}{'/' if node.is_dir else ''}"
+        # Iterative depth-first traversal with an explicit stack of (node, prefix, is_last).
+        # Children are pushed in reverse display order so they are popped in display order.
+        stack: List[Tuple[FileSystemNode, str, bool]] = []
 
-            if node.children:
-                new_prefix = prefix + ("    " if is_last else "│   ")
-                # Sort children: directories first, then files, both alphabetically
-                sorted_children = sorted(node.children, key=lambda n: (not n.is_dir, n.name.lower()))
+        def push_children(node: FileSystemNode, prefix: str) -> None:
+            sorted_children = node.display_children
+            last = len(sorted_children) - 1
+            for i in range(last, -1, -1):
+                stack.append((sorted_children[i], prefix, i == last))
 
-                # Process each child
-                for i, child in enumerate(sorted_children):
-                    is_last_child = i == len(sorted_children) - 1
-                    yield from write_node(child, new_prefix, is_last_child)
+        yield f"{self._tree.name}{_DIR_SUFFIX}"
+        push_children(self._tree, _LAST_INDENT)
 
-        yield from write_node(self._tree)
+        while stack:
+            node, prefix, is_last = stack.pop()
+            connector = _LAST_CONNECTOR if is_last else _CONNECTOR
+            suffix = _DIR_SUFFIX if node.is_dir else _FILE_SUFFIX
+            yield f"{prefix}{connector}{node.name}{suffix}"
+            if node.children:
+                push_children(node, prefix + (_LAST_INDENT if is_last else _INDENT))
 
     def get_tree_representation(self) -> str:
         """Get a complete string representation of the filesystem tree.
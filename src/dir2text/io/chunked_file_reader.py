@@ -2,6 +2,43 @@
 
 from typing import Iterator, TextIO
 
+# Every character for which str.isspace() is True, so boundary searches can use str.rfind
+_WHITESPACE = (
+    " \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007"
+    "\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+# Number of trailing characters searched first; a whitespace boundary is almost always found here
+_TAIL_WINDOW = 256
+
+
+def _rfind_whitespace(text: str) -> int:
+    """Find the index of the last whitespace character in text.
+
+    Each whitespace character is located with a C-level str.rfind scan. The trailing window
+    is searched first, so the common case only examines a few hundred characters, while text
+    with no whitespace at all is still scanned in C rather than one character at a time.
+
+    Args:
+        text: The text to search.
+
+    Returns:
+        The index of the last character for which str.isspace() is True, or -1 if none.
+
+    Example:
+        >>> _rfind_whitespace("hello world")
+        5
+        >>> _rfind_whitespace("line\\n" + "x" * 1000)
+        4
+        >>> _rfind_whitespace("nowhitespace")
+        -1
+    """
+    tail_start = max(0, len(text) - _TAIL_WINDOW)
+    index = max(text.rfind(c, tail_start) for c in _WHITESPACE)
+    if index == -1 and tail_start > 0:
+        index = max(text.rfind(c, 0, tail_start) for c in _WHITESPACE)
+    return index
+
 
 class ChunkedFileReader:
     """Iterator-based chunked file reader that breaks on whitespace boundaries.
@@ -70,15 +107,12 @@ class ChunkedFileReader:
 
         content += chunk
 
-        # If we have content, try to find the last whitespace
-        if content:
-            # Find last whitespace character
-            for i in range(len(content) - 1, -1, -1):
-                if content[i].isspace():
-                    # Split at this whitespace character
-                    self._buffer = content[i + 1 :]  # noqa: E203
-                    return content[: i + 1]
+        # Split after the last whitespace character, if there is one
+        i = _rfind_whitespace(content)
+        if i != -1:
+            self._buffer = content[i + 1 :]  # noqa: E203
+            return content[: i + 1]
 
-        # If no whitespace found or content is empty, return everything
+        # If no whitespace found, return everything
         self._buffer = ""
         return content
@@ -4,11 +4,14 @@ This module provides a strategy for formatting file content as JSON objects,
 supporting flexible token count placement and proper JSON escaping.
 """
 
-import json
-from typing import Optional
+from json.encoder import encode_basestring_ascii
+from typing import Optional, TextIO
 
 from .base_strategy import OutputStrategy
 
+# JSON string escaper, identical to the one used by json.JSONEncoder with its default ensure_ascii=True
+_escape = encode_basestring_ascii
+
 
 class JSONOutputStrategy(OutputStrategy):
     """Output strategy that formats file content as JSON objects.
@@ -24,12 +27,13 @@ class JSONOutputStrategy(OutputStrategy):
     and proper escaping. Each file's content is formatted as a single JSON string value,
     with appropriate escaping of special characters.
 
+    Content chunks must be str; bytes are not accepted and raise TypeError.
+
     Token counts can be provided in either format_start or format_end, but must be
     consistent if provided in both. This flexibility allows for both streaming and
     post-processed token counting approaches.
 
     Attributes:
-        encoder: JSON encoder instance used for consistent escaping.
         token_count: Token count provided at format_start, used for consistency
             validation at format_end.
 
@@ -43,26 +47,22 @@ class JSONOutputStrategy(OutputStrategy):
         ", "tokens": 42}
     """
 
+    # JSON is flexible about token count placement, allowing counts in either the opening or
+    # closing portion of the output. A plain class attribute avoids the property call per access.
+    requires_tokens_in_start = False
+
+    # Extension of the output files this strategy produces, as returned by get_file_extension
+    FILE_EXTENSION = ".json"
+
     def __init__(self) -> None:
         """Initialize the JSON output strategy.
 
-        Creates a JSON encoder instance for consistent escaping and initializes the
-        token count tracking.
+        Initializes the token count tracking. Escaping uses the module-level escaper, so no
+        per-instance encoder is needed.
         """
-        self.encoder = json.JSONEncoder()
         self.token_count: Optional[int] = None
-
-    @property
-    def requires_tokens_in_start(self) -> bool:
-        """Indicates whether token counts must be provided in format_start.
-
-        JSON format is flexible about token count placement, allowing counts in
-        either the opening or closing portion of the output.
-
-        Returns:
-            bool: False, indicating token counts can be provided in format_end.
-        """
-        return False
+        # Closing fragment precomputed at format_start when the token count is already known
+        self._end_fragment: Optional[str] = None
 
     def format_start(self, relative_path: str, file_token_count: Optional[int] = None) -> str:
         """Format the start of a JSON object for a file.
@@ -85,21 +85,18 @@ class JSONOutputStrategy(OutputStrategy):
             >>> print(strategy.format_start("src/main.py", 150))
             {"path": "src/main.py", "content": "
         """
-        data = {"path": relative_path}
         self.token_count = file_token_count
-
-        # Start the JSON object and the content field
-        start = self.encoder.encode(data)
-        start = start.rstrip("}")  # Remove the closing brace
-        start += ', "content": "'
-
-        return start
+        self._end_fragment = None if file_token_count is None else f'", "tokens": {file_token_count}}}'
+        # The keys are fixed, so only the path needs escaping; the object and the content string are left open
+        return f'{{"path": {_escape(relative_path)}, "content": "'
 
     def format_content(self, content: str) -> str:
         """Format a chunk of file content for JSON inclusion.
 
         Escapes the content chunk for inclusion in a JSON string value. The content
         is escaped without surrounding quotes since it's part of a larger string value.
+        Chunks that contain only printable ASCII other than quotes and backslashes need no
+        escaping and are returned unchanged.
 
         Args:
             content: A chunk of file content to format.
@@ -107,6 +104,9 @@ class JSONOutputStrategy(OutputStrategy):
         Returns:
             The JSON-escaped content string without surrounding quotes.
 
+        Raises:
+            TypeError: If content is not a str (e.g., bytes).
+
         Example:
             >>> strategy = JSONOutputStrategy()
             >>> print(strategy.format_content('line 1\\nprint("Hello")\\n'))
@@ -114,12 +114,47 @@ class JSONOutputStrategy(OutputStrategy):
             >>> print(strategy.format_content('path/with/\\backslash'))
             path/with/\\backslash
         """
-        # Create a temporary dictionary with our content as a value to get proper JSON escaping
-        temp_dict = {"content": content}
-        # Encode the dictionary and extract just our escaped content
-        json_str = self.encoder.encode(temp_dict)
-        # Extract just the content portion (everything between the quotes)
-        return json_str[len('{"content": "') : -2]  # noqa: E203
+        if type(content) is not str:
+            raise TypeError(f"content must be a str, not {type(content).__name__}")
+        if not content:
+            return content
+        # Fast path: nothing to escape. Each check is a C-level scan; the cheap ones run first and
+        # isprintable() (which rejects control characters such as newlines) runs last.
+        if content.isascii() and '"' not in content and "\\" not in content and content.isprintable():
+            return content
+        # Escape with the same (C-accelerated) routine JSONEncoder uses and strip the surrounding quotes
+        return _escape(content)[1:-1]
+
+    def write_content(self, content: str, out: TextIO) -> None:
+        """Write a chunk of file content, JSON-escaped, directly to a stream.
+
+        Chunks that need no escaping are written as-is without creating any intermediate
+        string. ``out`` may be a caller-owned ``io.StringIO`` reused across chunks and files
+        to accumulate output in a single buffer.
+
+        Args:
+            content: A chunk of file content to format.
+            out: Text stream to write the escaped content to.
+
+        Raises:
+            TypeError: If content is not a str (e.g., bytes).
+
+        Example:
+            >>> import io
+            >>> buf = io.StringIO()
+            >>> strategy = JSONOutputStrategy()
+            >>> strategy.write_content('say "hi"', buf)
+            >>> print(buf.getvalue())
+            say \\"hi\\"
+        """
+        if type(content) is not str:
+            raise TypeError(f"content must be a str, not {type(content).__name__}")
+        if not content:
+            return
+        if content.isascii() and '"' not in content and "\\" not in content and content.isprintable():
+            out.write(content)
+        else:
+            out.write(_escape(content)[1:-1])
 
     def format_end(self, file_token_count: Optional[int] = None) -> str:
         """Format the end of the JSON object for a file.
@@ -147,18 +182,19 @@ class JSONOutputStrategy(OutputStrategy):
             >>> print(strategy.format_end(None))
             "}
         """
-        end = '"'
-        if file_token_count is not None:
-            if self.token_count is not None and self.token_count != file_token_count:
-                raise ValueError(
-                    "Non-matching token counts supplied at format_start and format_end: "
-                    + f"'{self.token_count}' and '{file_token_count}'"
-                )
-            self.token_count = file_token_count
-        if self.token_count is not None:
-            end += f', "tokens": {self.token_count}'
-        end += "}"
-        return end
+        start_count = self.token_count
+        if file_token_count is None:
+            count = start_count
+        elif start_count is None or start_count == file_token_count:
+            count = self.token_count = file_token_count
+        else:
+            raise ValueError(
+                "Non-matching token counts supplied at format_start and format_end: "
+                + f"'{start_count}' and '{file_token_count}'"
+            )
+        if self._end_fragment is not None:
+            return self._end_fragment
+        return '"}' if count is None else f'", "tokens": {count}}}'
 
     def get_file_extension(self) -> str:
         """Get the file extension for JSON output.
@@ -171,4 +207,4 @@ class JSONOutputStrategy(OutputStrategy):
             >>> strategy.get_file_extension()
             '.json'
         """
-        return ".json"
+        return self.FILE_EXTENSION
@@ -16,12 +16,32 @@ the target model's tokenization.
 """
 
 import importlib.util
-from collections import namedtuple
-from typing import Any, Optional
+import os
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Optional, Sequence
 
 from dir2text.exceptions import TokenizationError, TokenizerNotAvailableError
 
-CountResult = namedtuple("CountResult", ["lines", "tokens", "characters"])
+# Probed once at import: find_spec walks the import system's path finders
+_TIKTOKEN_AVAILABLE = importlib.util.find_spec("tiktoken") is not None
+
+# Texts up to this length have their token counts memoized. Short texts such as tree lines,
+# separators and wrapper tags repeat constantly; longer content chunks rarely do.
+_SHORT_TEXT_LENGTH = 64
+
+
+@lru_cache(maxsize=8192)
+def _short_text_token_count(encoder: Any, text: str) -> int:
+    """Return the token count of a short text for the given encoder, memoized."""
+    return len(encoder.encode_ordinary(text))
+
+
+class CountResult(NamedTuple):
+    """Counts for a piece of text, as returned by TokenCounter.count."""
+
+    lines: int
+    tokens: int
+    characters: int
 
 
 class TokenCounter:
@@ -82,6 +102,8 @@ class TokenCounter:
         """
         self.model = model
         self.tiktoken_available = self._check_tiktoken()
+        # The encoder is only ever set when tiktoken is available, so the counting methods
+        # test the encoder alone on their hot path
         self.encoder: Optional[Any] = None
         if self.tiktoken_available:
             try:
@@ -99,7 +121,7 @@ class TokenCounter:
         Returns:
             True if tiktoken is installed, False otherwise.
         """
-        return importlib.util.find_spec("tiktoken") is not None
+        return _TIKTOKEN_AVAILABLE
 
     def _get_encoder(self) -> Optional[Any]:
         """Get the tiktoken encoder for the specified model.
@@ -166,16 +188,76 @@ class TokenCounter:
         self._total_lines += lines
         self._total_characters += chars
 
-        if self.tiktoken_available and self.encoder is not None:
+        if self.encoder is not None:
             try:
-                tokens = len(self.encoder.encode(text))
+                # encode_ordinary skips the special-token scan and treats text such as
+                # "<|endoftext|>" in file content as ordinary text instead of raising
+                if len(text) <= _SHORT_TEXT_LENGTH:
+                    tokens = _short_text_token_count(self.encoder, text)
+                else:
+                    tokens = len(self.encoder.encode_ordinary(text))
                 self._total_tokens += tokens
             except Exception as e:
                 # If token counting fails, we still keep the line and character counts
                 # but we need to let the caller know about the tokenization failure
                 raise TokenizationError(f"Failed to tokenize text: {str(e)}")
 
-        return CountResult(lines=lines, tokens=tokens, characters=chars)
+        return CountResult(lines, tokens, chars)
+
+    def count_batch(self, texts: Sequence[str]) -> List[CountResult]:
+        """Count lines, tokens, and characters in several texts at once.
+
+        Equivalent to calling count() on each text in order. Short texts go through the same
+        memoized path as count(). When two or more longer texts remain, they are tokenized with
+        a single tiktoken call that encodes them on parallel native threads. tiktoken starts a
+        thread pool for every such call, so a lone longer text is encoded directly instead.
+        Running totals are updated exactly as count() would update them.
+
+        Args:
+            texts: The texts to analyze.
+
+        Returns:
+            List[CountResult]: One result per input text, in the same order.
+
+        Raises:
+            TokenizationError: If token counting is available but fails. As with count(), the
+                line and character counts are still added to the running totals.
+
+        Example:
+            >>> counter = TokenCounter()
+            >>> [result.lines for result in counter.count_batch(["a\\nb", "c\\n\\nd"])]
+            [1, 2]
+            >>> counter.get_total_characters()
+            6
+        """
+        lines = [text.count("\n") for text in texts]
+        chars = [len(text) for text in texts]
+        tokens = [0] * len(texts)
+
+        self._total_lines += sum(lines)
+        self._total_characters += sum(chars)
+
+        if self.encoder is not None:
+            try:
+                long_indices = []
+                for i, text in enumerate(texts):
+                    if len(text) <= _SHORT_TEXT_LENGTH:
+                        tokens[i] = _short_text_token_count(self.encoder, text)
+                    else:
+                        long_indices.append(i)
+                if len(long_indices) == 1:
+                    tokens[long_indices[0]] = len(self.encoder.encode_ordinary(texts[long_indices[0]]))
+                elif long_indices:
+                    encoded = self.encoder.encode_ordinary_batch(
+                        [texts[i] for i in long_indices], num_threads=os.cpu_count() or 1
+                    )
+                    for i, ids in zip(long_indices, encoded):
+                        tokens[i] = len(ids)
+            except Exception as e:
+                raise TokenizationError(f"Failed to tokenize text: {str(e)}")
+            self._total_tokens += sum(tokens)
+
+        return [CountResult(n, t, c) for n, t, c in zip(lines, tokens, chars)]
 
     def get_total_tokens(self) -> int:
         """Get the total number of tokens counted so far.
@@ -1,5 +1,3 @@
-import os
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -7,16 +5,16 @@ import pytest
 from dir2text.exclusion_rules.git_rules import GitIgnoreExclusionRules
 
 
-@pytest.fixture
-def temp_gitignore():
-    with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-        f.write("*.txt\n")
-        f.write("!important.txt\n")
-        f.write("subdir/\n")
-        f.write("*.py[cod]\n")
-        f.write("**/__pycache__/\n")
-    yield f.name
-    os.unlink(f.name)
+@pytest.fixture(scope="session")
+def temp_gitignore(tmp_path_factory):
+    path = tmp_path_factory.mktemp("ignores") / "gitignore"
+    path.write_text("*.txt\n!important.txt\nsubdir/\n*.py[cod]\n**/__pycache__/\n")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def gitignore_rules(temp_gitignore):
+    return GitIgnoreExclusionRules(temp_gitignore)
 
 
 def create_absolute_path(path):
@@ -47,21 +45,64 @@ def create_absolute_path(path):
         ("lib/__pycache__/cache_file.py", True),
     ],
 )
-def test_gitignore_exclusion_rules(temp_gitignore, path, expected):
-    rules = GitIgnoreExclusionRules(temp_gitignore)
-    assert rules.exclude(path) == expected, f"Failed for path: {path}"
+def test_gitignore_exclusion_rules(gitignore_rules, path, expected):
+    assert gitignore_rules.exclude(path) == expected, f"Failed for path: {path}"
 
 
-def test_gitignore_exclusion_rules_empty_file():
-    with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-        pass
-    try:
-        rules = GitIgnoreExclusionRules(f.name)
-        assert not rules.exclude("any_file.txt"), "Empty .gitignore should not exclude any files"
-    finally:
-        os.unlink(f.name)
+def test_gitignore_exclusion_rules_empty_file(tmp_path):
+    path = tmp_path / "gitignore"
+    path.write_text("")
+    rules = GitIgnoreExclusionRules(str(path))
+    assert not rules.exclude("any_file.txt"), "Empty .gitignore should not exclude any files"
 
 
 def test_gitignore_exclusion_rules_nonexistent_file():
     with pytest.raises(FileNotFoundError):
         GitIgnoreExclusionRules("nonexistent_file")
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "file.txt",
+        "important.txt",
+        "subdir/important.txt",
+        "file.py",
+        "file.pyc",
+        "subdir/file.py",
+        "lib/__pycache__/cache_file.py",
+        "./file.txt",
+        "/absolute/important.txt",
+        "",
+    ],
+)
+def test_gitignore_exclusion_rules_match_pathspec(gitignore_rules, path):
+    assert gitignore_rules.exclude(path) == gitignore_rules.spec.match_file(path), f"Failed for path: {path}"
+
+
+def test_gitignore_exclusion_rules_last_match_wins(tmp_path):
+    path = tmp_path / "gitignore"
+    path.write_text("*.log\n!keep.log\nkeep.log\n")
+    rules = GitIgnoreExclusionRules(str(path))
+    assert rules.exclude("keep.log")
+    assert rules.exclude("other.log")
+
+
+@pytest.mark.parametrize(
+    "rules,directory,expected",
+    [
+        ("build/\n", "build", False),
+        ("build/\n!important.log\n", "build", True),
+        ("build/\n!build/keep.txt\n", "build", True),
+        ("build/\n!/build/\n", "build", True),
+        ("build/\n!src/keep.txt\n", "build", False),
+        ("build/\n!src/*/keep.txt\n", "src/build", True),
+        ("build/\n!src/*/keep.txt\n", "lib/build", False),
+        ("build/\n!**/keep.txt\n", "build", True),
+        ("build/\n!a\n", "build", True),
+    ],
+)
+def test_gitignore_exclusion_rules_may_include_below(tmp_path, rules, directory, expected):
+    path = tmp_path / "gitignore"
+    path.write_text(rules)
+    assert GitIgnoreExclusionRules(str(path)).may_include_below(directory) == expected
@@ -1,10 +1,11 @@
 """Unit tests for the ChunkedFileReader class."""
 
 import io
+import sys
 
 import pytest
 
-from dir2text.io.chunked_file_reader import ChunkedFileReader
+from dir2text.io.chunked_file_reader import _WHITESPACE, ChunkedFileReader
 
 
 def test_basic_chunked_reading() -> None:
@@ -110,3 +111,21 @@ def test_exact_chunk_size() -> None:
     chunks = list(reader)
     assert len(chunks) == 1
     assert len(chunks[0]) == 4096
+
+
+def test_whitespace_table_matches_isspace() -> None:
+    """Test that the boundary search recognizes exactly the characters str.isspace() does."""
+    expected = {c for c in map(chr, range(sys.maxunicode + 1)) if c.isspace()}
+    assert set(_WHITESPACE) == expected
+    assert len(_WHITESPACE) == len(expected)
+
+
+def test_unicode_whitespace_boundary() -> None:
+    """Test that non-ASCII whitespace far from the chunk end is used as a boundary."""
+    text = "x" * 1000 + "\u3000" + "y" * 5000
+    file_obj = io.StringIO(text)
+    reader = ChunkedFileReader(file_obj, chunk_size=4096)
+
+    chunks = list(reader)
+    assert chunks[0] == "x" * 1000 + "\u3000"
+    assert "".join(chunks) == text
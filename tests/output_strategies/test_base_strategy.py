@@ -0,0 +1,50 @@
+import io
+
+import pytest
+
+from dir2text.output_strategies.base_strategy import OutputStrategy
+from dir2text.output_strategies.json_strategy import JSONOutputStrategy
+from dir2text.output_strategies.xml_strategy import XMLOutputStrategy
+
+
+def test_base_methods_raise_not_implemented():
+    """Test that every interface method of the base class must be overridden."""
+    strategy = OutputStrategy()
+    with pytest.raises(NotImplementedError):
+        strategy.requires_tokens_in_start
+    with pytest.raises(NotImplementedError):
+        strategy.format_start("test.py")
+    with pytest.raises(NotImplementedError):
+        strategy.format_content("content")
+    with pytest.raises(NotImplementedError):
+        strategy.format_end()
+    with pytest.raises(NotImplementedError):
+        strategy.get_file_extension()
+
+
+@pytest.mark.parametrize("strategy_class", [JSONOutputStrategy, XMLOutputStrategy])
+def test_write_methods_match_format_methods(strategy_class):
+    """Test that the streaming write_* methods produce the same output as format_*."""
+    chunks = ["plain text ", 'with "quotes" & <tags>\n', "non-ascii é\t"]
+
+    expected_strategy = strategy_class()
+    expected = expected_strategy.format_start("dir/file.py", 7)
+    expected += "".join(expected_strategy.format_content(chunk) for chunk in chunks)
+    expected += expected_strategy.format_end()
+
+    strategy = strategy_class()
+    out = io.StringIO()
+    strategy.write_start("dir/file.py", out, 7)
+    for chunk in chunks:
+        strategy.write_content(chunk, out)
+    strategy.write_end(out)
+
+    assert out.getvalue() == expected
+
+
+def test_strategy_constants_are_class_attributes():
+    """Test that the fixed per-format settings are readable without an instance."""
+    assert JSONOutputStrategy.requires_tokens_in_start is False
+    assert XMLOutputStrategy.requires_tokens_in_start is True
+    assert JSONOutputStrategy().get_file_extension() == JSONOutputStrategy.FILE_EXTENSION == ".json"
+    assert XMLOutputStrategy().get_file_extension() == XMLOutputStrategy.FILE_EXTENSION == ".xml"
@@ -1,3 +1,4 @@
+import io
 import json
 
 import pytest
@@ -185,3 +186,72 @@ def test_json_formatting_consistency():
         assert parsed["content"] == args[1]
         if len(args) > 2:
             assert parsed["tokens"] == args[2]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "plain ascii text",
+        "tab\there",
+        'quote"d',
+        "back\\slash",
+        "control\x01char",
+        "del\x7fchar",
+        "non-ascii é",
+        "emoji 🌍",
+    ],
+)
+def test_format_content_matches_json_encoder(content):
+    """Test that the fast path and the escaping path both match json.dumps output."""
+    strategy = JSONOutputStrategy()
+    assert strategy.format_content(content) == json.dumps(content)[1:-1]
+
+
+@pytest.mark.parametrize("path", ["test.py", 'dir/"quoted".py', "win\\path.py", "naïve/文件.py", "tab\tname.py"])
+def test_format_start_matches_json_encoder(path):
+    """Test that the opening fragment matches what json.dumps produces for the same object."""
+    strategy = JSONOutputStrategy()
+    expected = json.dumps({"path": path, "content": ""})[:-2]
+    assert strategy.format_start(path) == expected
+
+
+def test_format_content_escapes_all_control_characters():
+    """Test that every ASCII control character is escaped exactly as json.dumps does."""
+    strategy = JSONOutputStrategy()
+    content = "".join(chr(c) for c in range(0x20)) + "\x7f"
+    assert strategy.format_content(content) == json.dumps(content)[1:-1]
+
+
+def test_empty_content_chunk():
+    """Test that empty chunks produce no output from either content method."""
+    strategy = JSONOutputStrategy()
+    assert strategy.format_content("") == ""
+
+    class FailingStream(io.StringIO):
+        def write(self, s):
+            raise AssertionError("write should not be called for an empty chunk")
+
+    strategy.write_content("", FailingStream())
+
+
+def test_strategy_reused_across_files():
+    """Test that token state from one file does not leak into the next."""
+    strategy = JSONOutputStrategy()
+    strategy.format_start("first.py", 10)
+    assert strategy.format_end() == '", "tokens": 10}'
+
+    strategy.format_start("second.py")
+    assert strategy.format_end() == '"}'
+
+    strategy.format_start("third.py")
+    assert strategy.format_end(5) == '", "tokens": 5}'
+
+
+def test_content_must_be_str():
+    """Test that non-str content chunks are rejected with a clear error."""
+    strategy = JSONOutputStrategy()
+    with pytest.raises(TypeError, match="content must be a str, not bytes"):
+        strategy.format_content(b"data")
+    with pytest.raises(TypeError, match="content must be a str, not bytes"):
+        strategy.write_content(b"data", io.StringIO())
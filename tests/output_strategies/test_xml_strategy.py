@@ -67,3 +67,28 @@ def test_complete_file_output():
     expected = '<file path="test.py" tokens="100">\ndef test():\n    print(&quot;Hello&quot;)</file>\n'
 
     assert "".join(output) == expected
+
+
+@pytest.mark.parametrize("length", [1, 255, 256, 5000])
+def test_format_content_short_and_long_chunks(length):
+    """Test that cached (short) and direct (long) escaping produce the same result."""
+    strategy = XMLOutputStrategy()
+    unit = "<a href=\"x\">'&'</a>"
+    content = (unit * (length // len(unit) + 1))[:length]
+    expected = (
+        content.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&apos;")
+    )
+    assert strategy.format_content(content) == expected
+    # A repeated call (served from the cache for short chunks) returns the same result
+    assert strategy.format_content(content) == expected
+
+
+def test_format_content_returns_clean_chunk_unchanged():
+    """Test that chunks without escapable characters are returned as-is."""
+    strategy = XMLOutputStrategy()
+    content = "def main():\n    return 0\n" * 100
+    assert strategy.format_content(content) is content
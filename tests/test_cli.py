@@ -0,0 +1,75 @@
+"""Unit tests for the cli.py module."""
+
+import errno
+import os
+from unittest.mock import patch
+
+import pytest
+
+from dir2text.cli import SafeWriter, main
+
+
+def test_safe_writer_flushes_at_buffer_threshold(tmp_path):
+    """Test that output is held in memory until BUFFER_SIZE characters are pending."""
+    writer = SafeWriter(tmp_path / "out.txt")
+    with patch("dir2text.cli.os.write", wraps=os.write) as mock_write:
+        writer.write("x" * (SafeWriter.BUFFER_SIZE - 1))
+        mock_write.assert_not_called()
+        writer.write("y")
+        assert mock_write.call_count == 1
+    writer.close()
+    assert (tmp_path / "out.txt").read_text() == "x" * (SafeWriter.BUFFER_SIZE - 1) + "y"
+
+
+def test_safe_writer_close_writes_pending_output(tmp_path):
+    """Test that close() writes output still below the buffer threshold."""
+    writer = SafeWriter(tmp_path / "out.txt")
+    writer.write("Hello, ")
+    writer.write("wörld!\n")
+    writer.close()
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8") == "Hello, wörld!\n"
+
+
+def test_safe_writer_retries_partial_writes(tmp_path):
+    """Test that a partial os.write is continued until all bytes are written."""
+    written = []
+
+    def partial_write(fd, data):
+        written.append(bytes(data[:3]))
+        return len(written[-1])
+
+    writer = SafeWriter(tmp_path / "out.txt")
+    writer.write("partial output")
+    with patch("dir2text.cli.os.write", side_effect=partial_write):
+        writer.flush()
+    writer.close()
+    assert b"".join(written) == b"partial output"
+    assert len(written) == 5
+
+
+def test_safe_writer_maps_epipe_to_broken_pipe(tmp_path):
+    """Test that EPIPE from os.write raises BrokenPipeError, which close() then ignores."""
+    writer = SafeWriter(tmp_path / "out.txt")
+    writer.write("data")
+    with patch("dir2text.cli.os.write", side_effect=OSError(errno.EPIPE, "Broken pipe")):
+        with pytest.raises(BrokenPipeError):
+            writer.flush()
+        writer.write("more data")
+        writer.close()
+
+
+def test_main_writes_output_file(tmp_path):
+    """Test that -o writes the complete output to the given file."""
+    source = tmp_path / "project"
+    source.mkdir()
+    (source / "main.py").write_text("print('Hello')\n")
+    output = tmp_path / "out.txt"
+
+    # Signal handlers are not installed so the test process keeps its own
+    with patch("dir2text.cli.setup_signal_handling"), patch("sys.argv", ["dir2text", str(source), "-o", str(output)]):
+        main()
+
+    text = output.read_text()
+    assert text.startswith("project/\n")
+    assert "└── main.py\n" in text
+    assert '<file path="main.py">\nprint(&apos;Hello&apos;)\n</file>' in text
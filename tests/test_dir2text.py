@@ -128,6 +128,20 @@ def test_streaming_dir2text_with_token_counting(temp_directory, mock_token_count
         assert analyzer.token_count > 0
 
 
+def test_streaming_dir2text_keeps_line_counts_when_tokenization_fails(temp_directory):
+    """Test that tree lines are still counted when the tokenizer fails on every text."""
+    encoder = MagicMock()
+    encoder.encode_ordinary.side_effect = Exception("Tokenization failed")
+    with patch("dir2text.token_counter._TIKTOKEN_AVAILABLE", True), patch(
+        "tiktoken.encoding_for_model", return_value=encoder
+    ):
+        analyzer = StreamingDir2Text(temp_directory, tokenizer_model="gpt-4")
+    tree_output = "".join(analyzer.stream_tree())
+    assert analyzer.line_count == tree_output.count("\n")
+    assert analyzer.character_count == len(tree_output)
+    encoder.encode_ordinary_batch.assert_not_called()
+
+
 def test_streaming_dir2text_output_formats(temp_directory):
     """Test different output formats."""
     # Test XML format
@@ -13,6 +13,7 @@ from dir2text.file_content_printer import FileContentPrinter
 from dir2text.file_system_tree import FileSystemTree
 from dir2text.output_strategies.json_strategy import JSONOutputStrategy
 from dir2text.output_strategies.xml_strategy import XMLOutputStrategy
+from dir2text.token_counter import CountResult, TokenCounter
 
 
 @pytest.fixture
@@ -206,3 +207,48 @@ def test_get_output_file_extension():
     # Test JSON strategy
     printer = FileContentPrinter(tree, output_format="json")
     assert printer.get_output_file_extension() == ".json"
+
+
+def test_start_tag_merged_with_first_chunk(temp_directory):
+    """Test that the start tag is emitted together with the first content chunk."""
+    (temp_directory / "empty.txt").write_text("")
+    tree = FileSystemTree(str(temp_directory))
+    printer = FileContentPrinter(tree, output_format="json", errors="replace")
+    chunks = {relative_path: list(content_iter) for _, relative_path, content_iter in printer.yield_file_contents()}
+
+    start = '{"path": "ascii.txt", "content": "'
+    assert chunks["ascii.txt"][0].startswith(start + "Hello")
+    assert "".join(chunks["ascii.txt"]) == start + 'Hello, world!"}'
+    assert chunks["empty.txt"] == ['{"path": "empty.txt", "content": ""}']
+
+
+def test_upfront_token_count_uses_batches(temp_directory):
+    """Test that token counts needed in the XML start tag are computed with batched counting."""
+    tokenizer = MagicMock(spec=TokenCounter)
+    tokenizer.count_batch.side_effect = lambda texts: [CountResult(lines=0, tokens=len(t), characters=0) for t in texts]
+    tree = FileSystemTree(str(temp_directory))
+    printer = FileContentPrinter(tree, output_format="xml", tokenizer=tokenizer, errors="replace")
+
+    chunks = {relative_path: "".join(content_iter) for _, relative_path, content_iter in printer.yield_file_contents()}
+
+    assert chunks["ascii.txt"].startswith('<file path="ascii.txt" tokens="13">')
+    tokenizer.count.assert_not_called()
+
+
+@pytest.mark.parametrize("chunks,batched", [(1, False), (2, True)])
+def test_upfront_token_count_batch_api_only_for_several_chunks(tmp_path, chunks, batched):
+    """Test that a single-chunk file is not tokenized through tiktoken's threaded batch API."""
+    (tmp_path / "data.txt").write_text("x" * (65536 * (chunks - 1) + 100))
+    encoder = MagicMock()
+    encoder.encode_ordinary.side_effect = lambda text: [0] * len(text)
+    encoder.encode_ordinary_batch.side_effect = lambda texts, num_threads: [[0] * len(text) for text in texts]
+    with patch("dir2text.token_counter._TIKTOKEN_AVAILABLE", True), patch(
+        "tiktoken.encoding_for_model", return_value=encoder
+    ):
+        tokenizer = TokenCounter()
+    printer = FileContentPrinter(FileSystemTree(str(tmp_path)), output_format="xml", tokenizer=tokenizer)
+
+    content = "".join(next(printer.yield_file_contents())[2])
+
+    assert content.startswith(f'<file path="data.txt" tokens="{65536 * (chunks - 1) + 100}">')
+    assert encoder.encode_ordinary_batch.called == batched
@@ -1,9 +1,11 @@
 import os
+from unittest.mock import patch
 
 import pytest
+from anytree.exporter import DictExporter, JsonExporter
 
 from dir2text.exclusion_rules.git_rules import GitIgnoreExclusionRules
-from dir2text.file_system_tree import FileSystemTree
+from dir2text.file_system_tree import FileSystemNode, FileSystemTree
 
 
 @pytest.fixture
@@ -167,3 +169,228 @@ def test_file_system_tree_zero_byte_files(temp_directory):
     fs_tree = FileSystemTree(str(temp_directory))
     tree = fs_tree.get_tree()
     assert any(node.name == "empty.txt" for node in tree.children)
+
+
+def test_file_system_tree_nested_relative_path_exclusion(temp_directory):
+    # Anchored patterns only match if relative paths are built with forward slashes from the root
+    gitignore_file = temp_directory / ".gitignore"
+    gitignore_file.write_text("/dir2/file2.py\n")
+    exclusion_rules = GitIgnoreExclusionRules(str(gitignore_file))
+    fs_tree = FileSystemTree(str(temp_directory), exclusion_rules)
+    relative_paths = [rel_path for _, rel_path in fs_tree.iterate_files()]
+    assert "dir2/file2.py" not in relative_paths
+    assert "dir2/file2.pyc" in relative_paths
+
+
+def test_file_system_tree_directory_symlink_is_dir(temp_directory):
+    # Directory entries must report symlinked directories as directories, like os.path.isdir
+    symlink = temp_directory / "link_dir"
+    try:
+        symlink.symlink_to(temp_directory / "dir1", target_is_directory=True)
+    except OSError:  # Handles cases where symlink creation requires privileges
+        pytest.skip("Symbolic link creation not supported")
+    fs_tree = FileSystemTree(str(temp_directory))
+    tree = fs_tree.get_tree()
+    link_node = next(node for node in tree.children if node.name == "link_dir")
+    assert link_node.is_dir
+    assert [child.name for child in link_node.children] == ["file1.txt"]
+
+
+def test_file_system_tree_parallel_matches_serial(temp_directory, temp_gitignore):
+    for i in range(5):
+        sub = temp_directory / f"sub_{i}" / "nested"
+        sub.mkdir(parents=True)
+        (sub / f"file_{i}.txt").touch()
+        (sub / f"file_{i}.pyc").touch()
+
+    exclusion_rules = GitIgnoreExclusionRules(temp_gitignore)
+    serial = FileSystemTree(str(temp_directory), exclusion_rules)
+    parallel = FileSystemTree(str(temp_directory), exclusion_rules, parallel=True)
+
+    assert parallel.get_tree_representation() == serial.get_tree_representation()
+    assert list(parallel.iterate_files()) == list(serial.iterate_files())
+    assert parallel.get_file_count() == serial.get_file_count()
+    assert parallel.get_directory_count() == serial.get_directory_count()
+
+
+def test_file_system_tree_representation(temp_directory):
+    (temp_directory / "dir2" / "sub").mkdir()
+    (temp_directory / "dir2" / "sub" / "deep.txt").touch()
+    (temp_directory / "top.txt").touch()
+    fs_tree = FileSystemTree(str(temp_directory))
+    expected = "\n".join(
+        [
+            f"{temp_directory.name}/",
+            "    ├── dir1/",
+            "    │   └── file1.txt",
+            "    ├── dir2/",
+            "    │   ├── sub/",
+            "    │   │   └── deep.txt",
+            "    │   ├── file2.py",
+            "    │   └── file2.pyc",
+            "    └── top.txt",
+        ]
+    )
+    assert fs_tree.get_tree_representation() == expected
+    assert list(fs_tree.stream_tree_representation()) == expected.split("\n")
+
+
+def test_file_system_node_display_children_cache_invalidation():
+    root = FileSystemNode("root", is_dir=True)
+    b = FileSystemNode("b.txt", parent=root)
+    assert [n.name for n in root.display_children] == ["b.txt"]
+
+    FileSystemNode("a", parent=root, is_dir=True)
+    assert [n.name for n in root.display_children] == ["a", "b.txt"]
+
+    b.parent = None
+    assert [n.name for n in root.display_children] == ["a"]
+
+
+def test_file_system_tree_exportable_after_representation(temp_directory):
+    # The display order cache must not leak into anytree's exporters
+    fs_tree = FileSystemTree(str(temp_directory))
+    fs_tree.get_tree_representation()
+    tree = fs_tree.get_tree()
+    assert "_display_children" not in DictExporter().export(tree)
+    assert '"dir1"' in JsonExporter().export(tree)
+
+
+def test_file_system_tree_interns_node_names(temp_directory):
+    (temp_directory / "dir1" / "README.md").touch()
+    (temp_directory / "dir2" / "README.md").touch()
+    tree = FileSystemTree(str(temp_directory)).get_tree()
+    readmes = [node for node in tree.descendants if node.name == "README.md"]
+    assert len(readmes) == 2
+    assert readmes[0].name is readmes[1].name
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_file_system_tree_symlink_loop(temp_directory, parallel):
+    # A symlink pointing back at an ancestor must not be traversed endlessly
+    try:
+        (temp_directory / "dir1" / "loop").symlink_to(temp_directory, target_is_directory=True)
+    except OSError:  # Handles cases where symlink creation requires privileges
+        pytest.skip("Symbolic link creation not supported")
+    fs_tree = FileSystemTree(str(temp_directory), parallel=parallel)
+    tree = fs_tree.get_tree()
+    dir1 = next(node for node in tree.children if node.name == "dir1")
+    loop = next(node for node in dir1.children if node.name == "loop")
+    assert loop.is_dir
+    assert loop.children == ()
+    assert fs_tree.get_file_count() == 3
+
+
+def test_file_system_tree_symlink_to_sibling_is_traversed(temp_directory):
+    # Symlinks to directories that are not ancestors are not loops and must be traversed
+    try:
+        (temp_directory / "dir1" / "to_dir2").symlink_to(temp_directory / "dir2", target_is_directory=True)
+    except OSError:  # Handles cases where symlink creation requires privileges
+        pytest.skip("Symbolic link creation not supported")
+    fs_tree = FileSystemTree(str(temp_directory))
+    relative_paths = [rel_path for _, rel_path in fs_tree.iterate_files()]
+    assert os.path.join("dir1", "to_dir2", "file2.py") in relative_paths
+    assert os.path.join("dir2", "file2.py") in relative_paths
+
+
+def test_file_system_tree_iterate_files_with_symlink_loop(temp_directory):
+    # iterate_files relies on the builder pruning loops; it keeps no visited set of its own
+    try:
+        (temp_directory / "dir2" / "back").symlink_to(temp_directory / "dir2", target_is_directory=True)
+    except OSError:  # Handles cases where symlink creation requires privileges
+        pytest.skip("Symbolic link creation not supported")
+    fs_tree = FileSystemTree(str(temp_directory))
+    relative_paths = [rel_path for _, rel_path in fs_tree.iterate_files()]
+    assert relative_paths == [
+        os.path.join("dir1", "file1.txt"),
+        os.path.join("dir2", "file2.py"),
+        os.path.join("dir2", "file2.pyc"),
+    ]
+
+
+def test_file_system_tree_symlink_loop_via_symlinked_root(temp_directory, tmp_path_factory):
+    # Loops must be detected by real path even when the root itself is reached through a symlink
+    alias = tmp_path_factory.mktemp("alias") / "root_alias"
+    try:
+        alias.symlink_to(temp_directory, target_is_directory=True)
+        (temp_directory / "dir1" / "loop").symlink_to(temp_directory, target_is_directory=True)
+    except OSError:  # Handles cases where symlink creation requires privileges
+        pytest.skip("Symbolic link creation not supported")
+    fs_tree = FileSystemTree(str(alias))
+    assert fs_tree.get_file_count() == 3
+
+
+def test_file_system_tree_keep_dir_entries(temp_directory):
+    (temp_directory / "dir1" / "file1.txt").write_text("hello")
+    tree = FileSystemTree(str(temp_directory), keep_dir_entries=True).get_tree()
+    dir1 = next(node for node in tree.children if node.name == "dir1")
+    file1 = dir1.children[0]
+    assert tree.stat() is None  # The root has no directory entry
+    assert file1.stat().st_size == 5
+    assert file1.stat() is file1.stat()  # Cached by the directory entry
+
+
+def test_file_system_tree_dir_entries_not_kept_by_default(temp_directory):
+    tree = FileSystemTree(str(temp_directory)).get_tree()
+    assert all(node.dir_entry is None and node.stat() is None for node in tree.descendants)
+
+
+@pytest.mark.parametrize("keep_dir_entries", [False, True])
+def test_file_system_tree_dir_entries_not_exported(temp_directory, keep_dir_entries):
+    # Retained entries are internal: they must not appear in repr() or anytree's exporters
+    tree = FileSystemTree(str(temp_directory), keep_dir_entries=keep_dir_entries).get_tree()
+    file1 = next(node for node in tree.descendants if node.name == "file1.txt")
+    assert "dir_entry" not in repr(file1)
+    assert "dir_entry" not in DictExporter().export(tree)["children"][0]["children"][0]
+    assert '"file1.txt"' in JsonExporter().export(tree)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_file_system_tree_directory_pattern_skips_listing(temp_directory, parallel):
+    # A "dir/" pattern excludes everything below the directory, so it is kept but never listed
+    (temp_directory / "dir2" / "nested").mkdir()
+    (temp_directory / "dir2" / "nested" / "deep.txt").touch()
+    gitignore_file = temp_directory / ".gitignore"
+    gitignore_file.write_text("dir2/\n")
+    fs_tree = FileSystemTree(str(temp_directory), GitIgnoreExclusionRules(str(gitignore_file)), parallel=parallel)
+    with patch.object(FileSystemTree, "_list_directory", wraps=FileSystemTree._list_directory) as list_directory:
+        tree = fs_tree.get_tree()
+    listed = [call.args[0] for call in list_directory.call_args_list]
+    assert str(temp_directory / "dir2") not in listed
+    dir2 = next(node for node in tree.children if node.name == "dir2")
+    assert dir2.children == ()
+    assert fs_tree.get_directory_count() == 2
+    assert fs_tree.get_file_count() == 2  # dir1/file1.txt and .gitignore
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_file_system_tree_directory_pattern_unaffected_by_unrelated_negation(temp_directory, parallel):
+    # Whether a "dir/" directory is shown must not depend on negations elsewhere in the rules
+    (temp_directory / "build").mkdir()
+    (temp_directory / "build" / "out.bin").touch()
+    (temp_directory / "dir1" / "debug.log").touch()
+    results = []
+    for rules in ["build/\n*.log\n", "build/\n*.log\n!important.log\n"]:
+        gitignore_file = temp_directory / ".gitignore"
+        gitignore_file.write_text(rules)
+        fs_tree = FileSystemTree(str(temp_directory), GitIgnoreExclusionRules(str(gitignore_file)), parallel=parallel)
+        representation = fs_tree.get_tree_representation()
+        assert "build/" in representation
+        assert "out.bin" not in representation
+        results.append((representation, fs_tree.get_directory_count()))
+    assert results[0] == results[1]
+    assert results[0][1] == 3
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+@pytest.mark.parametrize("rules", ["dir2/**\n!dir2/keep.txt\n", "dir2/\n!dir2/keep.txt\n"])
+def test_file_system_tree_negation_reincludes_file_in_excluded_directory(temp_directory, parallel, rules):
+    # A negation may re-include a file below a directory pattern, so the directory must not be pruned
+    (temp_directory / "dir2" / "keep.txt").touch()
+    gitignore_file = temp_directory / ".gitignore"
+    gitignore_file.write_text(rules)
+    fs_tree = FileSystemTree(str(temp_directory), GitIgnoreExclusionRules(str(gitignore_file)), parallel=parallel)
+    relative_paths = [rel_path for _, rel_path in fs_tree.iterate_files()]
+    assert os.path.join("dir2", "keep.txt") in relative_paths
+    assert os.path.join("dir2", "file2.py") not in relative_paths
+    assert fs_tree.get_directory_count() == 2
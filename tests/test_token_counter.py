@@ -8,20 +8,21 @@ from dir2text.token_counter import CountResult, TokenCounter
 
 @pytest.fixture
 def mock_tiktoken_available():
-    with patch("importlib.util.find_spec", return_value=True):
+    with patch("dir2text.token_counter._TIKTOKEN_AVAILABLE", True):
         yield
 
 
 @pytest.fixture
 def mock_tiktoken_unavailable():
-    with patch("importlib.util.find_spec", return_value=None):
+    with patch("dir2text.token_counter._TIKTOKEN_AVAILABLE", False):
         yield
 
 
 @pytest.fixture
 def mock_encoder():
     encoder = MagicMock()
-    encoder.encode.side_effect = lambda text: [0] * len(text)  # Mock tokenization
+    encoder.encode_ordinary.side_effect = lambda text: [0] * len(text)  # Mock tokenization
+    encoder.encode_ordinary_batch.side_effect = lambda texts, num_threads: [[0] * len(text) for text in texts]
     return encoder
 
 
@@ -95,7 +96,7 @@ def test_reset_counts(mock_tiktoken_available, mock_encoder):
 def test_tokenization_error(mock_tiktoken_available):
     with patch("tiktoken.encoding_for_model") as mock_encoding:
         mock_encoder = MagicMock()
-        mock_encoder.encode.side_effect = Exception("Tokenization failed")
+        mock_encoder.encode_ordinary.side_effect = Exception("Tokenization failed")
         mock_encoding.return_value = mock_encoder
 
         counter = TokenCounter()
@@ -166,7 +167,7 @@ def test_model_support_behavior(mock_tiktoken_available):
 
         # Test supported model
         mock_encoding_for_model.side_effect = None
-        mock_encoding_for_model.return_value = MagicMock(encode=lambda x: [0] * len(x))
+        mock_encoding_for_model.return_value = MagicMock(encode_ordinary=lambda x: [0] * len(x))
 
         counter = TokenCounter(model="gpt-4")
         result = counter.count("test")
@@ -228,3 +229,77 @@ def test_reset_counts_between_uses(mock_tiktoken_available, mock_encoder):
         result2 = counter.count("World")
         assert result2.tokens == 5  # Should not include previous counts
         assert counter.get_total_tokens() == 5  # Should only reflect second count
+
+
+def test_count_special_token_text(mock_tiktoken_available, mock_encoder):
+    """Test that special-token markers in content are counted as ordinary text."""
+    with patch("tiktoken.encoding_for_model", return_value=mock_encoder):
+        counter = TokenCounter()
+        counter.count("<|endoftext|>")
+        mock_encoder.encode_ordinary.assert_called_once_with("<|endoftext|>")
+        mock_encoder.encode.assert_not_called()
+
+
+def test_count_batch_matches_count(mock_tiktoken_available, mock_encoder):
+    """Test that batch counting returns per-text results and totals identical to count()."""
+    texts = ["Hello\n", "", "World!\nagain\n" * 10, "x\n" * 100]
+    with patch("tiktoken.encoding_for_model", return_value=mock_encoder):
+        single = TokenCounter()
+        expected = [single.count(text) for text in texts]
+
+        batched = TokenCounter()
+        assert batched.count_batch(texts) == expected
+        assert batched.get_total_tokens() == single.get_total_tokens()
+        assert batched.get_total_lines() == single.get_total_lines()
+        assert batched.get_total_characters() == single.get_total_characters()
+        assert mock_encoder.encode_ordinary_batch.call_count == 1
+
+
+def test_count_batch_without_tiktoken(mock_tiktoken_unavailable):
+    """Test batch counting when token counting is unavailable."""
+    counter = TokenCounter()
+    assert counter.count_batch(["a\n", "bc"]) == [
+        CountResult(lines=1, tokens=0, characters=2),
+        CountResult(lines=0, tokens=0, characters=2),
+    ]
+    assert counter.get_total_characters() == 4
+
+
+def test_count_batch_tokenization_error(mock_tiktoken_available, mock_encoder):
+    """Test that batch tokenization failures raise TokenizationError but keep line and character totals."""
+    mock_encoder.encode_ordinary_batch.side_effect = Exception("Tokenization failed")
+    with patch("tiktoken.encoding_for_model", return_value=mock_encoder):
+        counter = TokenCounter()
+        with pytest.raises(TokenizationError):
+            counter.count_batch(["x\n" * 100, "y" * 100])
+        assert counter.get_total_tokens() == 0
+        assert counter.get_total_lines() == 100
+        assert counter.get_total_characters() == 300
+
+
+def test_count_batch_avoids_batch_api_for_short_and_single_texts(mock_tiktoken_available, mock_encoder):
+    """Test that short texts use the memo and a lone long text is encoded without the batch API."""
+    with patch("tiktoken.encoding_for_model", return_value=mock_encoder):
+        counter = TokenCounter()
+        results = counter.count_batch(["a\n", "b\n", "x" * 1000])
+        assert [result.tokens for result in results] == [2, 2, 1000]
+        counter.count_batch(["a\n"])
+        mock_encoder.encode_ordinary_batch.assert_not_called()
+        calls = [call.args[0] for call in mock_encoder.encode_ordinary.call_args_list]
+        assert calls == ["a\n", "b\n", "x" * 1000]
+
+
+def test_short_text_token_counts_are_memoized(mock_tiktoken_available, mock_encoder):
+    """Test that repeated short texts are tokenized once while long texts always are."""
+    with patch("tiktoken.encoding_for_model", return_value=mock_encoder):
+        counter = TokenCounter()
+        short_text = "├── file.py\n"
+        long_text = "x" * 1000
+        for _ in range(3):
+            assert counter.count(short_text).tokens == len(short_text)
+            assert counter.count(long_text).tokens == len(long_text)
+
+        assert counter.get_total_tokens() == 3 * (len(short_text) + len(long_text))
+        calls = [call.args[0] for call in mock_encoder.encode_ordinary.call_args_list]
+        assert calls.count(short_text) == 1
+        assert calls.count(long_text) == 3